@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+
+from dogpile.cache import make_region
+
+
+class _LRUDict:
+    """Size-bounded mapping for dogpile's memory backend.
+
+    The backend only calls get, __setitem__ and pop. Handler threads share
+    it, so every operation holds a lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Bounded so one-off filter/search/cursor combinations can't grow the process
+# between writes; writes also drop every cached listing at once. The cache is
+# per process: other instances only see a write once their entries expire.
+_reminder_lists = _LRUDict(maxsize=256)
+
+# Bumped on every invalidation and folded into each key, so a load that was
+# already running when reminders changed stores its stale page under a key
+# nobody asks for again (the LRU ages it out).
+_generation = 0
+_generation_lock = threading.Lock()
+
+reminder_list_cache = make_region().configure(
+    "dogpile.cache.memory",
+    expiration_time=30,
+    arguments={"cache_dict": _reminder_lists},
+)
+
+
+def reminder_list_key(*parts) -> str:
+    """Build a cache key for a GET /reminders query in the current generation."""
+    return repr((_generation, *parts))
+
+
+def invalidate_reminder_lists():
+    """Drop all cached GET /reminders results after reminders change."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        _reminder_lists.clear()
@@ -1,18 +1,36 @@
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi.responses import Response
+from sqlalchemy.orm import Session, aliased, load_only
+from sqlalchemy import func, insert, or_, select, text, tuple_
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from database import engine, get_db, Base
-from models import Reminder, ReminderStatus
-from schemas import ReminderCreate, ReminderUpdate, ReminderResponse
+from models import Reminder, ReminderStatus, search_document
+from schemas import (
+    ReminderCreate,
+    ReminderBulkCreate,
+    ReminderUpdate,
+    ReminderResponse,
+    ReminderPage,
+    ReminderCounts,
+)
 from scheduler import start_scheduler, shutdown_scheduler
+from cache import reminder_list_cache, reminder_list_key, invalidate_reminder_lists
+
+_SCHEDULED = ReminderStatus.SCHEDULED
+
+# Columns GET /reminders may sort by
+_SORTABLE = {
+    "scheduled_at": Reminder.scheduled_at,
+    "created_at": Reminder.created_at,
+    "title": Reminder.title,
+}
 
 
 @asynccontextmanager
@@ -20,7 +38,7 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     start_scheduler()
     yield
-    shutdown_scheduler()
+    await shutdown_scheduler()
 
 
 app = FastAPI(
@@ -44,63 +62,169 @@ def health_check():
     return {"status": "healthy"}
 
 
-@app.post("/reminders", response_model=ReminderResponse, status_code=201)
-def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
-    now = datetime.now(timezone.utc)
-    scheduled_at = reminder.scheduled_at
+def _future_utc(scheduled_at: datetime, now: datetime, item: Optional[int] = None) -> datetime:
+    """Read a naive scheduled_at as UTC and reject times not in the future."""
     if scheduled_at.tzinfo is None:
-        scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
+        scheduled_at = scheduled_at.replace(tzinfo=UTC)
 
     if scheduled_at <= now:
-        raise HTTPException(status_code=400, detail="Scheduled time must be in the future")
+        detail = "Scheduled time must be in the future"
+        if item is not None:
+            detail = f"Item {item}: {detail}"
+        raise HTTPException(status_code=400, detail=detail)
+    return scheduled_at
+
 
+@app.post("/reminders", response_model=ReminderResponse, status_code=201)
+def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
     db_reminder = Reminder(
-        title=reminder.title,
-        message=reminder.message,
-        phone_number=reminder.phone_number,
-        scheduled_at=scheduled_at,
-        timezone=reminder.timezone,
-        status=ReminderStatus.SCHEDULED.value,
+        **reminder.model_dump(exclude={"scheduled_at"}),
+        scheduled_at=_future_utc(reminder.scheduled_at, datetime.now(UTC)),
+        status=_SCHEDULED,
     )
     db.add(db_reminder)
     db.commit()
     db.refresh(db_reminder)
+    invalidate_reminder_lists()
     return db_reminder
 
 
-@app.get("/reminders", response_model=list[ReminderResponse])
+@app.post("/reminders/bulk", response_model=list[ReminderResponse], status_code=201)
+def create_reminders_bulk(bulk: ReminderBulkCreate, db: Session = Depends(get_db)):
+    now = datetime.now(UTC)
+    rows = [
+        {
+            **reminder.model_dump(),
+            "scheduled_at": _future_utc(reminder.scheduled_at, now, item=index),
+            "status": _SCHEDULED,
+        }
+        for index, reminder in enumerate(bulk.items)
+    ]
+
+    # One executemany INSERT ... RETURNING for the whole batch; the returned
+    # rows already carry server defaults, so no per-row refresh is needed.
+    created = db.scalars(
+        insert(Reminder).returning(Reminder, sort_by_parameter_order=True), rows
+    ).all()
+    response = [ReminderResponse.model_validate(r) for r in created]
+    db.commit()
+    invalidate_reminder_lists()
+    return response
+
+
+@app.get("/reminders", response_model=ReminderPage)
 def list_reminders(
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search in title or message"),
     sort_by: str = Query("scheduled_at", description="Sort field"),
     sort_order: str = Query("asc", description="Sort order (asc/desc)"),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Reminder)
+    stmt = select(Reminder).options(
+        load_only(
+            Reminder.id,
+            Reminder.title,
+            Reminder.message,
+            Reminder.phone_number,
+            Reminder.scheduled_at,
+            Reminder.timezone,
+            Reminder.status,
+            Reminder.error_message,
+        )
+    )
 
     if status and status != "all":
-        query = query.filter(Reminder.status == status)
+        try:
+            status_filter = ReminderStatus(status)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Unknown status '{status}'")
+        stmt = stmt.where(Reminder.status == status_filter)
 
-    if search:
+    if search and engine.dialect.name == "postgresql":
+        query = func.websearch_to_tsquery(text("'simple'"), search)
+        stmt = stmt.where(search_document.op("@@")(query))
+    elif search:
         search_term = f"%{search}%"
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 Reminder.title.ilike(search_term),
                 Reminder.message.ilike(search_term),
             )
         )
 
-    if sort_order == "desc":
-        query = query.order_by(getattr(Reminder, sort_by).desc())
+    sort_column = _SORTABLE.get(sort_by)
+    if sort_column is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot sort by '{sort_by}'; expected one of: {', '.join(_SORTABLE)}",
+        )
+    descending = sort_order == "desc"
+
+    # id breaks ties so every row has a unique position to resume from
+    if descending:
+        stmt = stmt.order_by(sort_column.desc(), Reminder.id.desc())
     else:
-        query = query.order_by(getattr(Reminder, sort_by).asc())
+        stmt = stmt.order_by(sort_column.asc(), Reminder.id.asc())
 
-    return query.all()
+    if cursor is not None:
+        # Keyset pagination: seek past the previous page's last row instead
+        # of scanning and discarding an OFFSET. The anchor row is joined in
+        # so its sort value is compared as stored rather than round-tripped
+        # through Python.
+        anchor = aliased(Reminder)
+        position = tuple_(sort_column, Reminder.id)
+        anchor_key = tuple_(getattr(anchor, sort_column.key), anchor.id)
+        stmt = stmt.join(anchor, anchor.id == cursor).where(
+            position < anchor_key if descending else position > anchor_key
+        )
+
+    def load():
+        # One extra row tells us whether another page exists
+        rows = db.scalars(stmt.limit(limit + 1)).all()
+        # The anchor join yields nothing once the cursor row is deleted; say
+        # so rather than passing off a truncated walk as the last page.
+        if not rows and cursor is not None and db.get(Reminder, cursor) is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid cursor {cursor}; restart from the first page",
+            )
+        items = rows[:limit]
+        page = {"items": items, "next_cursor": items[-1].id if len(rows) > limit else None}
+        # Validate and encode the whole page in a single pydantic-core pass
+        # and cache the bytes, so hits skip serialization entirely.
+        return ReminderPage.model_validate(page, from_attributes=True).model_dump_json()
+
+    cache_key = reminder_list_key(status, search, sort_by, sort_order, limit, cursor)
+    return Response(
+        content=reminder_list_cache.get_or_create(cache_key, load),
+        media_type="application/json",
+    )
+
+
+@app.get("/reminders/counts", response_model=ReminderCounts)
+def count_reminders(db: Session = Depends(get_db)):
+    def load():
+        # One GROUP BY pass, so the dashboard's tab counts don't require
+        # paging through every reminder
+        counts = {status.value: 0 for status in ReminderStatus}
+        for status, count in db.execute(
+            select(Reminder.status, func.count()).group_by(Reminder.status)
+        ):
+            if status is not None:
+                counts[status.value] = count
+        return ReminderCounts(all=sum(counts.values()), **counts).model_dump_json()
+
+    return Response(
+        content=reminder_list_cache.get_or_create(reminder_list_key("counts"), load),
+        media_type="application/json",
+    )
 
 
 @app.get("/reminders/{reminder_id}", response_model=ReminderResponse)
 def get_reminder(reminder_id: int, db: Session = Depends(get_db)):
-    reminder = db.query(Reminder).filter(Reminder.id == reminder_id).first()
+    reminder = db.get(Reminder, reminder_id)
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
     return reminder
@@ -112,11 +236,11 @@ def update_reminder(
     reminder_update: ReminderUpdate,
     db: Session = Depends(get_db),
 ):
-    reminder = db.query(Reminder).filter(Reminder.id == reminder_id).first()
+    reminder = db.get(Reminder, reminder_id)
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
 
-    if reminder.status != ReminderStatus.SCHEDULED.value:
+    if reminder.status != _SCHEDULED:
         raise HTTPException(
             status_code=400,
             detail="Cannot update a reminder that has already been processed",
@@ -125,27 +249,24 @@ def update_reminder(
     update_data = reminder_update.model_dump(exclude_unset=True)
 
     if "scheduled_at" in update_data:
-        scheduled_at = update_data["scheduled_at"]
-        if scheduled_at.tzinfo is None:
-            scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
-        if scheduled_at <= datetime.now(timezone.utc):
-            raise HTTPException(status_code=400, detail="Scheduled time must be in the future")
-        update_data["scheduled_at"] = scheduled_at
+        update_data["scheduled_at"] = _future_utc(update_data["scheduled_at"], datetime.now(UTC))
 
     for field, value in update_data.items():
         setattr(reminder, field, value)
 
     db.commit()
     db.refresh(reminder)
+    invalidate_reminder_lists()
     return reminder
 
 
 @app.delete("/reminders/{reminder_id}", status_code=204)
 def delete_reminder(reminder_id: int, db: Session = Depends(get_db)):
-    reminder = db.query(Reminder).filter(Reminder.id == reminder_id).first()
+    reminder = db.get(Reminder, reminder_id)
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
 
     db.delete(reminder)
     db.commit()
+    invalidate_reminder_lists()
     return None
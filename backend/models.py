@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index, text
 from sqlalchemy.sql import func
 from database import Base
 import enum
@@ -6,12 +6,28 @@ import enum
 
 class ReminderStatus(str, enum.Enum):
     SCHEDULED = "scheduled"
+    PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
 
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Partial index covering only the rows the scheduler polls for
+        Index(
+            "ix_reminders_due",
+            "status",
+            "scheduled_at",
+            postgresql_where=text("status = 'scheduled'"),
+            sqlite_where=text("status = 'scheduled'"),
+        ),
+        # One per GET /reminders sort order, matching its (column, id) keyset
+        # so each page is an index range scan rather than a full sort
+        Index("ix_reminders_scheduled_at_id", "scheduled_at", "id"),
+        Index("ix_reminders_created_at_id", "created_at", "id"),
+        Index("ix_reminders_title_id", "title", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
@@ -19,8 +35,23 @@ class Reminder(Base):
     phone_number = Column(String(20), nullable=False)
     scheduled_at = Column(DateTime(timezone=True), nullable=False)
     timezone = Column(String(50), nullable=False)
-    status = Column(String(20), default=ReminderStatus.SCHEDULED.value)
+    # Native ENUM on PostgreSQL; labels are the lowercase values the API uses
+    status = Column(
+        Enum(ReminderStatus, name="reminder_status", values_callable=lambda e: [m.value for m in e]),
+        default=ReminderStatus.SCHEDULED,
+    )
     call_id = Column(String(100), nullable=True)
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Document matched by full-text search on PostgreSQL. The GIN index is built
+# on this exact expression so the planner can use it for @@ queries; SQLite
+# has no tsvector support and skips the index.
+search_document = func.to_tsvector(
+    text("'simple'"),
+    Reminder.title.op("||")(text("' '")).op("||")(Reminder.message),
+)
+
+Index("ix_reminders_search", search_document, postgresql_using="gin").ddl_if(dialect="postgresql")
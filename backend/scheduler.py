@@ -1,111 +1,224 @@
+import asyncio
 import httpx
 import os
-from datetime import datetime, timezone
-from sqlalchemy.orm import Session
-from apscheduler.schedulers.background import BackgroundScheduler
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+from sqlalchemy import bindparam, select, update
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from database import SessionLocal
 from models import Reminder, ReminderStatus
+from cache import invalidate_reminder_lists
 
-scheduler = BackgroundScheduler()
+scheduler = AsyncIOScheduler()
 
+_SCHEDULED = ReminderStatus.SCHEDULED
+_PROCESSING = ReminderStatus.PROCESSING
+_COMPLETED = ReminderStatus.COMPLETED
+_FAILED = ReminderStatus.FAILED
 
-def get_vapi_client() -> httpx.Client:
-    return httpx.Client(
+
+def get_vapi_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
         base_url="https://api.vapi.ai",
         headers={
             "Authorization": f"Bearer {os.getenv('VAPI_API_KEY', '')}",
             "Content-Type": "application/json",
         },
+        http2=True,
         timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+    )
+
+
+# Shared across ticks so keep-alive connections outlive a single batch.
+_client = get_vapi_client()
+
+# Constant parts of the transient assistant, shared by every call payload
+_MODEL = {"provider": "openai", "model": "gpt-4o"}
+_VOICE = {"provider": "11labs", "voiceId": "21m00Tcm4TlvDq8ikWAM"}
+
+# Upper bound on Vapi calls in flight at once, to stay clear of rate limits
+_MAX_CONCURRENT_CALLS = 32
+
+# A claim this old belongs to a run that died before writing back (crash,
+# shutdown mid-tick); a full batch of timed-out calls finishes well within it.
+_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+# Core executemany rather than an ORM bulk UPDATE: a reminder deleted while
+# its call was in flight simply matches no row instead of raising
+# StaleDataError and losing the write-back for the whole batch.
+_reminders = Reminder.__table__
+_write_back = (
+    update(_reminders)
+    .where(_reminders.c.id == bindparam("b_id"))
+    .values(
+        status=bindparam("b_status"),
+        call_id=bindparam("b_call_id"),
+        error_message=bindparam("b_error_message"),
     )
+)
+
+
+@dataclass
+class CallResult:
+    """Outcome of a single Vapi call, written back in one batch per tick."""
 
+    id: int
+    status: ReminderStatus
+    call_id: Optional[str] = None
+    error_message: Optional[str] = None
 
-def trigger_vapi_call(reminder: Reminder, db: Session) -> bool:
+
+async def trigger_vapi_call(reminder: Reminder) -> CallResult:
     """Trigger a Vapi call for the given reminder."""
     vapi_api_key = os.getenv("VAPI_API_KEY")
     vapi_phone_number_id = os.getenv("VAPI_PHONE_NUMBER_ID")
 
     if not vapi_api_key or not vapi_phone_number_id:
-        reminder.status = ReminderStatus.FAILED.value
-        reminder.error_message = "Vapi API key or phone number ID not configured"
-        db.commit()
-        return False
+        return CallResult(
+            id=reminder.id,
+            status=_FAILED,
+            error_message="Vapi API key or phone number ID not configured",
+        )
 
     try:
-        with get_vapi_client() as client:
-            # Using POST /call endpoint with transient assistant
-            # Docs: https://docs.vapi.ai/api-reference/calls/create
-            response = client.post(
-                "/call",
-                json={
-                    "phoneNumberId": vapi_phone_number_id,
-                    "customer": {
-                        "number": reminder.phone_number,
-                    },
-                    "assistant": {
-                        "name": "Reminder Assistant",
-                        "firstMessage": f"Hello! This is your reminder: {reminder.title}. {reminder.message}",
-                        "model": {
-                            "provider": "openai",
-                            "model": "gpt-4o",
-                            "messages": [
-                                {
-                                    "role": "system",
-                                    "content": f"You are a friendly reminder assistant. Your only job is to deliver this reminder message: '{reminder.message}'. After delivering the message, ask if they have any questions about the reminder, then politely end the call. Keep your responses brief and helpful.",
-                                }
-                            ],
-                        },
-                        "voice": {
-                            "provider": "11labs",
-                            "voiceId": "21m00Tcm4TlvDq8ikWAM",
-                        },
+        # Using POST /call endpoint with transient assistant
+        # Docs: https://docs.vapi.ai/api-reference/calls/create
+        response = await _client.post(
+            "/call",
+            json={
+                "phoneNumberId": vapi_phone_number_id,
+                "customer": {
+                    "number": reminder.phone_number,
+                },
+                "assistant": {
+                    "name": "Reminder Assistant",
+                    "firstMessage": f"Hello! This is your reminder: {reminder.title}. {reminder.message}",
+                    "model": {
+                        **_MODEL,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": f"You are a friendly reminder assistant. Your only job is to deliver this reminder message: '{reminder.message}'. After delivering the message, ask if they have any questions about the reminder, then politely end the call. Keep your responses brief and helpful.",
+                            }
+                        ],
                     },
+                    "voice": _VOICE,
                 },
-            )
+            },
+        )
 
-            if response.status_code in (200, 201):
-                data = response.json()
-                reminder.status = ReminderStatus.COMPLETED.value
-                reminder.call_id = data.get("id")
-                db.commit()
-                return True
-            else:
-                reminder.status = ReminderStatus.FAILED.value
-                reminder.error_message = f"Vapi API error: {response.status_code} - {response.text}"
-                db.commit()
-                return False
+        if response.status_code in (200, 201):
+            data = response.json()
+            return CallResult(
+                id=reminder.id,
+                status=_COMPLETED,
+                call_id=data.get("id"),
+            )
+        else:
+            return CallResult(
+                id=reminder.id,
+                status=_FAILED,
+                error_message=f"Vapi API error: {response.status_code} - {response.text}",
+            )
 
     except Exception as e:
-        reminder.status = ReminderStatus.FAILED.value
-        reminder.error_message = f"Failed to trigger call: {str(e)}"
-        db.commit()
-        return False
+        return CallResult(
+            id=reminder.id,
+            status=_FAILED,
+            error_message=f"Failed to trigger call: {str(e)}",
+        )
 
 
-def process_due_reminders():
-    """Check for due reminders and trigger calls."""
-    db = SessionLocal()
+def _claim_due_reminders() -> list[Reminder]:
+    """Re-queue stale claims, then claim and return the next due batch."""
+    # Claimed reminders are read after the session closes, so keep them loaded
+    db = SessionLocal(expire_on_commit=False)
     try:
-        now = datetime.now(timezone.utc)
-        due_reminders = (
-            db.query(Reminder)
-            .filter(
-                Reminder.status == ReminderStatus.SCHEDULED.value,
+        now = datetime.now(UTC)
+        requeued = db.execute(
+            update(Reminder)
+            .where(
+                Reminder.status == _PROCESSING,
+                Reminder.updated_at < now - _CLAIM_TIMEOUT,
+            )
+            .values(status=_SCHEDULED)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if requeued:
+            print(f"Re-queued {requeued} reminder(s) with stale processing claims")
+
+        due_ids = (
+            select(Reminder.id)
+            .where(
+                Reminder.status == _SCHEDULED,
                 Reminder.scheduled_at <= now,
             )
-            .all()
+            .order_by(Reminder.scheduled_at)
+            .with_for_update(skip_locked=True)
+            .limit(100)
+            .scalar_subquery()
         )
+        # Claim the batch atomically: rows move to "processing" in the same
+        # statement that selects them, so concurrent workers or scheduler
+        # instances each get a disjoint set and no reminder is dialled twice.
+        due_reminders = db.scalars(
+            update(Reminder)
+            .where(Reminder.id.in_(due_ids))
+            .values(status=_PROCESSING)
+            .returning(Reminder)
+        ).all()
+        db.commit()
+        return due_reminders
+    finally:
+        db.close()
 
-        for reminder in due_reminders:
-            print(f"Processing reminder {reminder.id}: {reminder.title}")
-            trigger_vapi_call(reminder, db)
 
+def _write_back_results(results: list[CallResult]):
+    """Store a tick's call outcomes."""
+    db = SessionLocal()
+    try:
+        # One executemany and one commit for the whole batch rather than a
+        # commit per reminder.
+        db.execute(
+            _write_back,
+            [{f"b_{field}": value for field, value in asdict(result).items()} for result in results],
+        )
+        db.commit()
     finally:
         db.close()
 
 
+async def process_due_reminders():
+    """Check for due reminders and trigger calls."""
+    # The database work is blocking (pool checkout, lock waits), so it runs in
+    # a worker thread; only the Vapi calls share the app's event loop.
+    due_reminders = await asyncio.to_thread(_claim_due_reminders)
+    if not due_reminders:
+        return
+
+    invalidate_reminder_lists()
+
+    for reminder in due_reminders:
+        print(f"Processing reminder {reminder.id}: {reminder.title}")
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+
+    async def call(reminder: Reminder) -> CallResult:
+        async with semaphore:
+            return await trigger_vapi_call(reminder)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(call(r)) for r in due_reminders]
+    results = [task.result() for task in tasks]
+
+    await asyncio.to_thread(_write_back_results, results)
+    invalidate_reminder_lists()
+
+
 def start_scheduler():
     """Start the background scheduler."""
     scheduler.add_job(
@@ -113,11 +226,17 @@ def start_scheduler():
         trigger=IntervalTrigger(seconds=30),
         id="process_reminders",
         replace_existing=True,
+        # A slow batch must not overlap the next tick (and re-dial the same
+        # reminders); missed ticks collapse into a single catch-up run.
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=60,
     )
     scheduler.start()
     print("Scheduler started - checking for due reminders every 30 seconds")
 
 
-def shutdown_scheduler():
-    """Shutdown the scheduler."""
+async def shutdown_scheduler():
+    """Shutdown the scheduler and close the Vapi client."""
     scheduler.shutdown()
+    await _client.aclose()
@@ -1,50 +1,80 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 import re
 
+from models import ReminderStatus
+
+_PHONE_PATTERN = r"^\+[1-9]\d{1,14}$"
+_PHONE_RE = re.compile(_PHONE_PATTERN)
+
+
+def _validate_phone(v: str) -> str:
+    if not _PHONE_RE.match(v):
+        raise ValueError("Phone number must be in E.164 format (e.g., +14155552671)")
+    return v
+
+
+# Checked in Python so create and update give the same E.164 hint; the
+# pattern is still published in the OpenAPI schema.
+PhoneNumber = Annotated[
+    str,
+    AfterValidator(_validate_phone),
+    Field(json_schema_extra={"pattern": _PHONE_PATTERN}),
+]
+
 
 class ReminderBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     message: str = Field(..., min_length=1)
-    phone_number: str = Field(..., pattern=r"^\+[1-9]\d{1,14}$")
+    phone_number: PhoneNumber
     scheduled_at: datetime
     timezone: str = Field(..., min_length=1)
 
-    @field_validator("phone_number")
-    @classmethod
-    def validate_phone(cls, v: str) -> str:
-        if not re.match(r"^\+[1-9]\d{1,14}$", v):
-            raise ValueError("Phone number must be in E.164 format (e.g., +14155552671)")
-        return v
-
 
 class ReminderCreate(ReminderBase):
     pass
 
 
+class ReminderBulkCreate(BaseModel):
+    items: list[ReminderCreate] = Field(..., min_length=1, max_length=500)
+
+
 class ReminderUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     message: Optional[str] = Field(None, min_length=1)
-    phone_number: Optional[str] = None
+    phone_number: Optional[PhoneNumber] = None
     scheduled_at: Optional[datetime] = None
     timezone: Optional[str] = None
 
-    @field_validator("phone_number")
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(r"^\+[1-9]\d{1,14}$", v):
-            raise ValueError("Phone number must be in E.164 format (e.g., +14155552671)")
-        return v
 
+class ReminderListResponse(ReminderBase):
+    """Dashboard listing; call_id and timestamps are only on the detail view."""
 
-class ReminderResponse(ReminderBase):
     id: int
-    status: str
-    call_id: Optional[str] = None
+    status: ReminderStatus
     error_message: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class ReminderPage(BaseModel):
+    items: list[ReminderListResponse]
+    next_cursor: Optional[int] = None
+
+
+class ReminderCounts(BaseModel):
+    """Reminder totals per status, for the dashboard's filter tabs."""
+
+    all: int
+    scheduled: int
+    processing: int
+    completed: int
+    failed: int
+
+
+class ReminderResponse(ReminderListResponse):
+    call_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
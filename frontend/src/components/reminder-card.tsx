@@ -4,7 +4,7 @@ import { useState, useEffect } from "react";
 import { useMutation, useQueryClient } from "@tanstack/react-query";
 import { format, formatDistanceToNow, isPast } from "date-fns";
 import { toZonedTime } from "date-fns-tz";
-import { api, Reminder } from "@/lib/api";
+import { api, ReminderSummary } from "@/lib/api";
 
 // Parse datetime string as UTC (append Z if not present)
 function parseAsUTC(dateString: string): Date {
@@ -43,7 +43,7 @@ import {
 import { cn } from "@/lib/utils";
 
 interface ReminderCardProps {
-  reminder: Reminder;
+  reminder: ReminderSummary;
 }
 
 function maskPhone(phone: string): string {
@@ -51,7 +51,7 @@ function maskPhone(phone: string): string {
   return phone.slice(0, -4).replace(/\d(?=.{4})/g, "•") + phone.slice(-4);
 }
 
-function getStatusConfig(status: Reminder["status"]) {
+function getStatusConfig(status: ReminderSummary["status"]) {
   switch (status) {
     case "scheduled":
       return {
@@ -59,6 +59,12 @@ function getStatusConfig(status: Reminder["status"]) {
         icon: Timer,
         className: "bg-sky-100 text-sky-700 border-sky-200",
       };
+    case "processing":
+      return {
+        label: "Processing",
+        icon: Loader2,
+        className: "bg-amber-100 text-amber-700 border-amber-200",
+      };
     case "completed":
       return {
         label: "Completed",
@@ -4,7 +4,7 @@ import { useState, useEffect, useCallback } from "react";
 import { useMutation, useQueryClient } from "@tanstack/react-query";
 import { format } from "date-fns";
 import { toZonedTime } from "date-fns-tz";
-import { api, CreateReminderData, Reminder, UpdateReminderData } from "@/lib/api";
+import { api, CreateReminderData, ReminderSummary, UpdateReminderData } from "@/lib/api";
 
 // Parse datetime string as UTC (append Z if not present)
 function parseAsUTC(dateString: string): Date {
@@ -29,7 +29,7 @@ import { Phone, Calendar, Clock, MessageSquare, Sparkles, Loader2, Globe, AlertC
 import { cn } from "@/lib/utils";
 
 interface ReminderFormProps {
-  reminder?: Reminder;
+  reminder?: ReminderSummary;
   onSuccess?: () => void;
   onCancel?: () => void;
 }
@@ -1,7 +1,7 @@
 "use client";
 
 import { useState, useMemo } from "react";
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery, useQuery, keepPreviousData } from "@tanstack/react-query";
 import { api, Reminder } from "@/lib/api";
 import { Input } from "@/components/ui/input";
 import { Tabs, TabsList, TabsTrigger } from "@/components/ui/tabs";
@@ -11,7 +11,7 @@ import { Search, AlertCircle, RefreshCw } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { Button } from "./ui/button";
 
-type StatusFilter = "all" | "scheduled" | "completed" | "failed";
+type StatusFilter = "all" | "scheduled" | "processing" | "completed" | "failed";
 
 interface ReminderListProps {
   onCreateClick?: () => void;
@@ -21,50 +21,41 @@ export function ReminderList({ onCreateClick }: ReminderListProps) {
   const [statusFilter, setStatusFilter] = useState<StatusFilter>("all");
   const [searchQuery, setSearchQuery] = useState("");
 
-  // Always fetch all reminders for accurate tab counts
-  const { data: allReminders = [] } = useQuery({
-    queryKey: ["reminders", "all"],
-    queryFn: () =>
-      api.getReminders({
-        sort_by: "scheduled_at",
-        sort_order: "asc",
-      }),
+  // Tab counts come from a single GROUP BY rather than loading every reminder
+  const { data: statusCounts } = useQuery({
+    queryKey: ["reminders", "counts"],
+    queryFn: () => api.getReminderCounts(),
   });
 
+  // The list is paged; further pages are fetched only when asked for
   const {
-    data: reminders = [],
+    data,
     isLoading,
     isError,
     error,
     refetch,
-  } = useQuery({
-    queryKey: ["reminders", statusFilter],
-    queryFn: () =>
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ["reminders", statusFilter, searchQuery.trim()],
+    queryFn: ({ pageParam }) =>
       api.getReminders({
         status: statusFilter === "all" ? undefined : statusFilter,
+        search: searchQuery.trim() || undefined,
         sort_by: "scheduled_at",
         sort_order: "asc",
+        cursor: pageParam,
       }),
+    initialPageParam: null as number | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+    placeholderData: keepPreviousData,
   });
 
-  const filteredReminders = useMemo(() => {
-    if (!searchQuery.trim()) return reminders;
-    const query = searchQuery.toLowerCase();
-    return reminders.filter(
-      (r) =>
-        r.title.toLowerCase().includes(query) ||
-        r.message.toLowerCase().includes(query)
-    );
-  }, [reminders, searchQuery]);
-
-  const statusCounts = useMemo(() => {
-    return {
-      all: allReminders.length,
-      scheduled: allReminders.filter((r) => r.status === "scheduled").length,
-      completed: allReminders.filter((r) => r.status === "completed").length,
-      failed: allReminders.filter((r) => r.status === "failed").length,
-    };
-  }, [allReminders]);
+  const reminders = useMemo(
+    () => data?.pages.flatMap((page) => page.items) ?? [],
+    [data]
+  );
 
   if (isError) {
     return (
@@ -98,25 +89,31 @@ export function ReminderList({ onCreateClick }: ReminderListProps) {
             <TabsTrigger value="all" className="px-4 data-[state=active]:bg-white">
               All
               <span className="ml-1.5 text-xs text-zinc-400">
-                {statusCounts.all}
+                {statusCounts?.all ?? 0}
               </span>
             </TabsTrigger>
             <TabsTrigger value="scheduled" className="px-4 data-[state=active]:bg-white">
               Scheduled
               <span className="ml-1.5 text-xs text-zinc-400">
-                {statusCounts.scheduled}
+                {statusCounts?.scheduled ?? 0}
+              </span>
+            </TabsTrigger>
+            <TabsTrigger value="processing" className="px-4 data-[state=active]:bg-white">
+              Processing
+              <span className="ml-1.5 text-xs text-zinc-400">
+                {statusCounts?.processing ?? 0}
               </span>
             </TabsTrigger>
             <TabsTrigger value="completed" className="px-4 data-[state=active]:bg-white">
               Completed
               <span className="ml-1.5 text-xs text-zinc-400">
-                {statusCounts.completed}
+                {statusCounts?.completed ?? 0}
               </span>
             </TabsTrigger>
             <TabsTrigger value="failed" className="px-4 data-[state=active]:bg-white">
               Failed
               <span className="ml-1.5 text-xs text-zinc-400">
-                {statusCounts.failed}
+                {statusCounts?.failed ?? 0}
               </span>
             </TabsTrigger>
           </TabsList>
@@ -145,20 +142,31 @@ export function ReminderList({ onCreateClick }: ReminderListProps) {
               <ReminderCardSkeleton key={i} />
             ))}
           </div>
-        ) : filteredReminders.length === 0 ? (
+        ) : reminders.length === 0 ? (
           searchQuery ? (
             <EmptyState type="no-results" searchQuery={searchQuery} />
-          ) : reminders.length === 0 ? (
-            <EmptyState type="no-reminders" onCreateClick={onCreateClick} />
           ) : (
-            <EmptyState type="no-results" searchQuery={statusFilter} />
+            <EmptyState type="no-reminders" onCreateClick={onCreateClick} />
           )
         ) : (
-          <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
-            {filteredReminders.map((reminder) => (
-              <ReminderCard key={reminder.id} reminder={reminder} />
-            ))}
-          </div>
+          <>
+            <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
+              {reminders.map((reminder) => (
+                <ReminderCard key={reminder.id} reminder={reminder} />
+              ))}
+            </div>
+            {hasNextPage && (
+              <div className="flex justify-center mt-6">
+                <Button
+                  onClick={() => fetchNextPage()}
+                  disabled={isFetchingNextPage}
+                  variant="outline"
+                >
+                  {isFetchingNextPage ? "Loading..." : "Load more"}
+                </Button>
+              </div>
+            )}
+          </>
         )}
       </div>
     </div>
@@ -7,13 +7,29 @@ export interface Reminder {
   phone_number: string;
   scheduled_at: string;
   timezone: string;
-  status: "scheduled" | "completed" | "failed";
+  status: "scheduled" | "processing" | "completed" | "failed";
   call_id: string | null;
   error_message: string | null;
   created_at: string;
   updated_at: string;
 }
 
+// GET /reminders omits detail-only fields; fetch a single reminder for those.
+export type ReminderSummary = Omit<Reminder, "call_id" | "created_at" | "updated_at">;
+
+export interface ReminderPage {
+  items: ReminderSummary[];
+  next_cursor: number | null;
+}
+
+export interface ReminderCounts {
+  all: number;
+  scheduled: number;
+  processing: number;
+  completed: number;
+  failed: number;
+}
+
 export interface CreateReminderData {
   title: string;
   message: string;
@@ -57,7 +73,8 @@ export const api = {
     search?: string;
     sort_by?: string;
     sort_order?: string;
-  }): Promise<Reminder[]> {
+    cursor?: number | null;
+  }): Promise<ReminderPage> {
     const searchParams = new URLSearchParams();
     if (params?.status && params.status !== "all") {
       searchParams.set("status", params.status);
@@ -71,9 +88,17 @@ export const api = {
     if (params?.sort_order) {
       searchParams.set("sort_order", params.sort_order);
     }
+    if (params?.cursor != null) {
+      searchParams.set("cursor", String(params.cursor));
+    }
     const url = `${API_URL}/reminders${searchParams.toString() ? `?${searchParams}` : ""}`;
     const response = await fetch(url);
-    return handleResponse<Reminder[]>(response);
+    return handleResponse<ReminderPage>(response);
+  },
+
+  async getReminderCounts(): Promise<ReminderCounts> {
+    const response = await fetch(`${API_URL}/reminders/counts`);
+    return handleResponse<ReminderCounts>(response);
   },
 
   async getReminder(id: number): Promise<Reminder> {